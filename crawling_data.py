@@ -28,10 +28,6 @@ GENDERS = {
 today_str = datetime.now().strftime('%y%m%d')
 base_filename = f'./data/daily_{today_str}.csv'
 
-if os.path.exists(base_filename):
-    print(f"daily_{today_str} 파일이 이미 존재합니다.")
-    exit()
-
 # 크롬 드라이버 설정
 chrome_options = Options()
 chrome_options.add_argument('--headless')
@@ -40,7 +36,24 @@ chrome_options.add_argument('--no-sandbox')
 chrome_options.add_argument('--window-size=1920,1080')
 chrome_options.add_argument('--start-maximized')
 chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36')
-driver = webdriver.Chrome(options=chrome_options)
+
+# 모듈을 import 하는 것만으로 브라우저가 뜨지 않도록 필요할 때 생성
+driver = None
+
+def create_driver():
+    """
+    크롤링용 크롬 드라이버를 새로 생성하는 함수
+    """
+    return webdriver.Chrome(options=chrome_options)
+
+def get_driver():
+    """
+    드라이버를 따로 넘기지 않았을 때 사용할 모듈 공용 드라이버 반환
+    """
+    global driver
+    if driver is None:
+        driver = create_driver()
+    return driver
 
 contents = []
 visited_urls = set()
@@ -57,6 +70,13 @@ PLATFORMS = {
     'boxoffice': 'boxoffice'
 }
 
+# 랭킹 기간 (파일명 접두사 -> URL의 period 값, 일간은 기본 페이지)
+PERIODS = {
+    'daily': '',
+    'weekly': 'weekly',
+    'monthly': 'monthly'
+}
+
 def select_age_gender(driver, age_group, gender):
     """
     브라우저에서 나이와 성별 선택을 위한 함수
@@ -93,19 +113,81 @@ def select_age_gender(driver, age_group, gender):
         print(f"나이 {age_group}와 성별 {gender} 선택 중 오류 발생: {str(e)}")
         return False
 
-def scrape_ranking_data(period='', age_group=None, gender=None):
+def ranking_url(platform_url, period=''):
     """
-    주어진 기간과 나이, 성별에 따라 각 플랫폼의 랭킹 데이터를 스크래핑
+    플랫폼과 기간에 해당하는 랭킹 페이지 URL 생성
     """
-    all_contents = []
-    base_url = "https://www.kinolights.com/ranking/{platform}"
+    url = f"https://www.kinolights.com/ranking/{platform_url}"
     if period:
-        base_url += f"?period={period}"
+        url += f"?period={period}"
+    return url
+
+def open_ranking_page(driver, url):
+    """
+    랭킹 페이지를 열고 로딩될 때까지 대기
+    """
+    driver.get(url)
+    time.sleep(3)
+
+def parse_ranking_page(driver, platform_name, age_group=None, gender=None):
+    """
+    현재 열려 있는 랭킹 페이지에서 항목을 스크래핑
+    """
+    contents = []
+    try:
+        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        ranking_items = soup.find_all('div', class_='content-list-card content-list-card--md')
+        print(f"{platform_name}에서 {len(ranking_items)}개 항목 발견 (나이: {AGE_GROUPS.get(age_group, '전체')}, 성별: {GENDERS.get(gender, '전체')})")
+        
+        for item in ranking_items:
+            try:
+                rank = item.select_one('.ranking-item__number .rank__number').text.strip()
+                title = item.select_one('.info__title').text.strip()
+                subtitle = item.select_one('.info__subtitle').text.strip()
+                genre, year = subtitle.split(' · ')
+                score = item.select_one('.score__number').text.strip()
+                
+                contents.append({
+                    'rank': int(rank),
+                    'title': title,
+                    'genre': genre,
+                    'year': year,
+                    'score': float(score),
+                    'platform': platform_name,
+                    'age_group': AGE_GROUPS.get(age_group, '전체'),
+                    'gender': GENDERS.get(gender, '전체')
+                })
+            except Exception as e:
+                print(f"항목 스크래핑 오류: {str(e)}")
+                continue
+    except Exception as e:
+        print(f"{platform_name}에서 랭킹 항목을 찾는 중 오류 발생: {str(e)}")
     
+    return contents
+
+def is_age_gender_selected(driver, age_group, gender):
+    """
+    현재 페이지의 나이-성별 선택 버튼 라벨이 주어진 나이와 성별을 가리키는지 확인
+    라벨을 읽을 수 없으면 선택되지 않은 것으로 간주
+    """
+    try:
+        label = driver.find_element(By.CSS_SELECTOR, ".age-gender-select__button").text
+    except Exception:
+        return False
+    # 성별은 '남성'/'남자'처럼 표기가 다를 수 있어 첫 글자로 비교
+    return AGE_GROUPS[age_group] in label and GENDERS[gender][0] in label
+
+def scrape_ranking_data(period='', age_group=None, gender=None, driver=None):
+    """
+    주어진 기간과 나이, 성별에 따라 각 플랫폼의 랭킹 데이터를 스크래핑
+    driver를 넘기지 않으면 모듈 공용 드라이버를 사용
+    """
+    if driver is None:
+        driver = get_driver()
+    
+    all_contents = []
     for platform_name, platform_url in PLATFORMS.items():
-        url = base_url.format(platform=platform_url)
-        driver.get(url)
-        time.sleep(3)
+        open_ranking_page(driver, ranking_url(platform_url, period))
         
         # 나이, 성별 그룹이 있는 경우 가져오기
         if age_group and gender:
@@ -113,34 +195,7 @@ def scrape_ranking_data(period='', age_group=None, gender=None):
             if not success:
                 print(f"{platform_name}에서 나이/성별 설정 실패, 기본값으로 진행합니다.")
         
-        try:
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            ranking_items = soup.find_all('div', class_='content-list-card content-list-card--md')
-            print(f"{platform_name}에서 {len(ranking_items)}개 항목 발견 (나이: {AGE_GROUPS.get(age_group, '전체')}, 성별: {GENDERS.get(gender, '전체')})")
-            
-            for item in ranking_items:
-                try:
-                    rank = item.select_one('.ranking-item__number .rank__number').text.strip()
-                    title = item.select_one('.info__title').text.strip()
-                    subtitle = item.select_one('.info__subtitle').text.strip()
-                    genre, year = subtitle.split(' · ')
-                    score = item.select_one('.score__number').text.strip()
-                    
-                    all_contents.append({
-                        'rank': int(rank),
-                        'title': title,
-                        'genre': genre,
-                        'year': year,
-                        'score': float(score),
-                        'platform': platform_name,
-                        'age_group': AGE_GROUPS.get(age_group, '전체'),
-                        'gender': GENDERS.get(gender, '전체')
-                    })
-                except Exception as e:
-                    print(f"항목 스크래핑 오류: {str(e)}")
-                    continue
-        except Exception as e:
-            print(f"{platform_name}에서 랭킹 항목을 찾는 중 오류 발생: {str(e)}")
+        all_contents.extend(parse_ranking_page(driver, platform_name, age_group, gender))
     
     return all_contents
 
@@ -152,6 +207,8 @@ def combine_duplicate_contents(contents):
         # 제목, 년도, 나이 그룹, 성별을 키로 사용하여 중복 방지
         key = (content['title'], content['year'], content['age_group'], content['gender'])
         if key not in content_dict:
+            # rank는 처음 수집된 플랫폼의 순위이므로 플랫폼별 순위는 따로 보관 ("netflix:1, tving:5")
+            content['platform_ranks'] = f"{content['platform']}:{content['rank']}"
             content_dict[key] = content
         else:
             # 이미 존재하는 콘텐츠의 플랫폼 정보에 현재 플랫폼 추가
@@ -159,13 +216,20 @@ def combine_duplicate_contents(contents):
             platforms = set(existing['platform'].split(', '))
             platforms.add(content['platform'])
             existing['platform'] = ', '.join(sorted(platforms))
+            
+            ranks = dict(item.split(':') for item in existing['platform_ranks'].split(', '))
+            ranks.setdefault(content['platform'], str(content['rank']))
+            existing['platform_ranks'] = ', '.join(f"{name}:{rank}" for name, rank in sorted(ranks.items()))
     
     return list(content_dict.values())
 
-def scrape_daily_content():
+def scrape_daily_content(driver=None):
     """
     남성과 여성을 위한 일간 콘텐츠 랭킹 데이터를 수집하는 함수
     
+    Args:
+        driver: 재사용할 크롬 드라이버 (없으면 새로 띄우고 수집 후 종료)
+    
     Returns:
         male_df: 남성 선호 콘텐츠 데이터프레임
         female_df: 여성 선호 콘텐츠 데이터프레임
@@ -175,6 +239,11 @@ def scrape_daily_content():
     
     today_str = datetime.now().strftime('%y%m%d')
     
+    # 드라이버를 직접 띄운 경우에만 수집 후 종료
+    owns_driver = driver is None
+    if owns_driver:
+        driver = create_driver()
+    
     try:
         # 남성과 여성 데이터를 위한 파일 생성
         male_contents = []
@@ -186,7 +255,7 @@ def scrape_daily_content():
                 print(f"{age_value} {gender_value}의 일간 랭킹 스크래핑 중...")
                 
                 # 해당 나이 및 성별 조합에 대한 콘텐츠 가져오기
-                contents = scrape_ranking_data('', age_key, gender_key)
+                contents = scrape_ranking_data('', age_key, gender_key, driver)
                 
                 # 적절한 성별 컬렉션에 추가
                 if contents:
@@ -219,11 +288,133 @@ def scrape_daily_content():
     except Exception as e:
         print(f"일간 콘텐츠 랭킹 수집 중 오류 발생: {str(e)}")
         return None, None
+    finally:
+        if owns_driver:
+            driver.quit()
+
+def print_period_timings(timings):
+    """
+    기간별 수집 시간을 출력 (기간을 하나 더 추가할 때의 비용 확인용)
+    """
+    print("\n=== 기간별 수집 시간 ===")
+    setup = timings['setup']
+    print(f"나이/성별 선택: {setup['count']}회, 확인 포함 {setup['seconds']:.1f}초")
+    for period, timing in timings['periods'].items():
+        per_page = timing['seconds'] / timing['pages'] if timing['pages'] else 0
+        print(f"{period}: 페이지 {timing['pages']}개, 항목 {timing['items']}개, "
+              f"{timing['seconds']:.1f}초 (페이지당 {per_page:.1f}초)")
+    print(f"전체: {timings['total_seconds']:.1f}초")
+
+def scrape_multi_period_content(periods=('daily', 'weekly', 'monthly'), driver=None):
+    """
+    여러 기간(일간/주간/월간)의 남성/여성 랭킹 데이터를 한 번에 수집하는 함수
+    
+    나이/성별 세그먼트마다 하나의 브라우저 세션에서 모든 플랫폼과 기간을 순회한다.
+    페이지마다 나이-성별 버튼 라벨로 현재 선택을 확인하고, 새로고침 후 선택이
+    풀려 있으면 다시 선택한다 (선택이 유지되면 세그먼트당 한 번만 선택).
+    기간별 결과는 daily_*.csv와 같은 형식으로 {기간}_MALE/FEMALE_{날짜}.csv에 저장한다.
+    
+    Args:
+        periods: 수집할 기간 목록 (PERIODS의 키)
+        driver: 재사용할 크롬 드라이버 (없으면 새로 띄우고 수집 후 종료)
+    
+    Returns:
+        results: {기간: (male_df, female_df)} 딕셔너리
+        timings: 나이/성별 선택 시간과 기간별 페이지 수, 항목 수, 소요 시간
+    """
+    # 같은 기간이 중복으로 들어와도 한 번만 수집 (순서 유지)
+    periods = list(dict.fromkeys(periods))
+    unknown = [period for period in periods if period not in PERIODS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 기간입니다: {', '.join(unknown)}")
+    
+    if not os.path.exists('./data'):
+        os.makedirs('./data')
+    
+    today_str = datetime.now().strftime('%y%m%d')
+    results = {period: (None, None) for period in periods}
+    timings = {
+        'setup': {'count': 0, 'seconds': 0.0},
+        'periods': {period: {'pages': 0, 'items': 0, 'seconds': 0.0} for period in periods},
+        'total_seconds': 0.0
+    }
+    
+    # 드라이버를 직접 띄운 경우에만 수집 후 종료
+    owns_driver = driver is None
+    if owns_driver:
+        driver = create_driver()
+    
+    started = time.perf_counter()
+    try:
+        period_contents = {period: {'MALE': [], 'FEMALE': []} for period in periods}
+        
+        for gender_key, gender_value in GENDERS.items():
+            for age_key, age_value in AGE_GROUPS.items():
+                print(f"{age_value} {gender_value}의 {', '.join(periods)} 랭킹 스크래핑 중...")
+                segment_contents = {period: [] for period in periods}
+                
+                for platform_name, platform_url in PLATFORMS.items():
+                    for period in periods:
+                        timing = timings['periods'][period]
+                        
+                        page_started = time.perf_counter()
+                        open_ranking_page(driver, ranking_url(platform_url, PERIODS[period]))
+                        timing['seconds'] += time.perf_counter() - page_started
+                        
+                        # 새로고침 후에도 나이/성별 선택이 유지됐는지 확인하고, 아니면 다시 선택
+                        select_started = time.perf_counter()
+                        if not is_age_gender_selected(driver, age_key, gender_key):
+                            timings['setup']['count'] += 1
+                            if not select_age_gender(driver, age_key, gender_key):
+                                print(f"{platform_name}에서 나이/성별 설정 실패, 기본값으로 진행합니다.")
+                        timings['setup']['seconds'] += time.perf_counter() - select_started
+                        
+                        parse_started = time.perf_counter()
+                        contents = parse_ranking_page(driver, platform_name, age_key, gender_key)
+                        timing['seconds'] += time.perf_counter() - parse_started
+                        timing['pages'] += 1
+                        timing['items'] += len(contents)
+                        segment_contents[period].extend(contents)
+                
+                # 일간 수집과 같은 방식으로 세그먼트 안의 중복 콘텐츠 통합
+                for period in periods:
+                    if segment_contents[period]:
+                        combined = combine_duplicate_contents(segment_contents[period])
+                        print(f"{age_value} {gender_value} {period}에서 {len(combined)}개 항목 발견")
+                        period_contents[period][gender_key].extend(combined)
+        
+        # 기간별 남성/여성 데이터 파일 저장
+        for period in periods:
+            dfs = {}
+            for gender_key in GENDERS:
+                filename = f'./data/{period}_{gender_key}_{today_str}.csv'
+                dfs[gender_key] = None
+                if period_contents[period][gender_key]:
+                    dfs[gender_key] = pd.DataFrame(period_contents[period][gender_key])
+                    dfs[gender_key].to_csv(filename, index=False)
+                    print(f"{len(dfs[gender_key])}개 항목을 {filename}에 저장했습니다.")
+            results[period] = (dfs['MALE'], dfs['FEMALE'])
+    
+    except Exception as e:
+        print(f"기간별 콘텐츠 랭킹 수집 중 오류 발생: {str(e)}")
+    finally:
+        if owns_driver:
+            driver.quit()
+        timings['total_seconds'] = time.perf_counter() - started
+        print_period_timings(timings)
+    
+    return results, timings
 
 def main():
+    if os.path.exists(base_filename):
+        print(f"daily_{today_str} 파일이 이미 존재합니다.")
+        return
+    
     if not os.path.exists('./data'):
         os.makedirs('./data')
     
+    driver = create_driver()
+    
     try:
         # 남성과 여성 데이터를 위한 파일 생성
         male_contents = []
@@ -235,7 +426,7 @@ def main():
                 print(f"{age_value} {gender_value}의 일간 랭킹 스크래핑 중...")
                 
                 # 해당 나이 및 성별 조합에 대한 콘텐츠 가져오기
-                contents = scrape_ranking_data('', age_key, gender_key)
+                contents = scrape_ranking_data('', age_key, gender_key, driver)
                 
                 # 적절한 성별 컬렉션에 추가
                 if contents:
@@ -0,0 +1,479 @@
+import os
+import json
+import time
+import queue
+import signal
+import argparse
+import threading
+from datetime import datetime, timedelta
+from contextlib import contextmanager
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import main as pipeline
+from crawling_data import PERIODS, create_driver
+from genre_collector import collect_missing_genres
+from ott_survey import load_ott_survey
+from ranking_index import RankingIndex
+
+DATA_DIR = './data'
+CONTENTS_FILENAME = f'{DATA_DIR}/contents.csv'
+
+def browser_memory_mb(driver):
+    """
+    chromedriver와 그 하위 크롬 프로세스들의 메모리(RSS) 합계를 MB 단위로 반환
+    /proc 가 없는 환경이면 None 반환
+    """
+    try:
+        root_pid = driver.service.process.pid
+    except AttributeError:
+        return None
+    if not os.path.isdir('/proc'):
+        return None
+
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    children = {}
+    rss = {}
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{name}/stat') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # 프로세스 이름에 공백이 있을 수 있어 마지막 ')' 이후 필드만 사용
+        fields = stat[stat.rfind(')') + 2:].split()
+        pid = int(name)
+        children.setdefault(int(fields[1]), []).append(pid)
+        rss[pid] = int(fields[21]) * page_size
+
+    total = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += rss.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total / (1024 * 1024)
+
+class BrowserPool:
+    """
+    실행 사이에 크롬 드라이버를 띄워둔 채로 재사용하는 풀
+    메모리 사용량이나 사용 횟수가 기준을 넘으면 드라이버를 새로 띄움
+    """
+    def __init__(self, size=1, max_memory_mb=1024, max_uses=20):
+        self.size = size
+        self.max_memory_mb = max_memory_mb
+        self.max_uses = max_uses
+        self.recycled = 0
+        self._idle = queue.LifoQueue()
+        self._uses = {}
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _create(self):
+        driver = create_driver()
+        self._uses[id(driver)] = 0
+        return driver
+
+    def _is_alive(self, driver):
+        """
+        브라우저 세션이 살아 있는지 확인 (크롬이나 chromedriver가 죽으면 예외 발생)
+        """
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _quit(self, driver):
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"브라우저 종료 중 오류 발생: {str(e)}")
+
+    def warm_up(self):
+        """
+        풀 크기만큼 브라우저를 미리 띄워둠
+        """
+        while True:
+            with self._lock:
+                if self._created >= self.size:
+                    return
+                self._created += 1
+            try:
+                self._idle.put(self._create())
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+    @contextmanager
+    def acquire(self):
+        """
+        풀에서 드라이버를 빌려주고, 사용이 끝나면 상태를 확인해 반납하거나 교체
+        """
+        driver = self._get()
+        broken = False
+        try:
+            yield driver
+        except Exception:
+            broken = True
+            raise
+        finally:
+            self._release(driver, broken)
+
+    def _get(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if self._is_alive(driver):
+                return driver
+            # 쉬는 동안 죽은 브라우저는 버리고 자리를 비움
+            print("응답하지 않는 브라우저를 교체합니다.")
+            self._quit(driver)
+            self.recycled += 1
+            with self._lock:
+                self._created -= 1
+
+        with self._lock:
+            can_create = self._created < self.size
+            if can_create:
+                self._created += 1
+        if not can_create:
+            return self._idle.get()
+
+        try:
+            return self._create()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def _release(self, driver, broken):
+        self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+        uses = self._uses[id(driver)]
+        memory = browser_memory_mb(driver)
+
+        reason = None
+        if broken:
+            reason = "작업 중 오류"
+        elif not self._is_alive(driver):
+            # 수집 함수가 예외를 삼키므로 세션이 죽었는지는 직접 확인
+            reason = "응답 없음"
+        elif memory is not None and memory >= self.max_memory_mb:
+            reason = f"메모리 {memory:.0f}MB 사용"
+        elif uses >= self.max_uses:
+            reason = f"{uses}회 사용"
+
+        if reason is None:
+            self._idle.put(driver)
+            return
+
+        print(f"브라우저를 교체합니다 ({reason}).")
+        self._quit(driver)
+        self.recycled += 1
+        try:
+            # 다음 실행도 바로 시작할 수 있도록 새 브라우저를 미리 띄워둠
+            self._idle.put(self._create())
+        except Exception as e:
+            print(f"새 브라우저 생성 중 오류 발생: {str(e)}")
+            with self._lock:
+                self._created -= 1
+
+    def close(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(driver)
+            with self._lock:
+                self._created -= 1
+
+    def status(self):
+        idle = list(self._idle.queue)
+        return {
+            'size': self.size,
+            'created': self._created,
+            'idle': len(idle),
+            'recycled': self.recycled,
+            'memory_mb': [round(m, 1) for m in (browser_memory_mb(d) for d in idle) if m is not None]
+        }
+
+class PipelineDaemon:
+    """
+    main.run_pipeline을 상주 프로세스로 실행하는 스케줄러
+    - daily: 매일 지정 시각에 랭킹 수집(periods의 기간들) 및 훈련 데이터 생성
+    - enrich: 주기적으로 genre_detail이 없는 콘텐츠의 상세 정보를 조금씩 수집
+    """
+    def __init__(self, daily_at='09:00', enrich_interval=600, enrich_batch=20, pool=None, periods=('daily',)):
+        self.daily_at = datetime.strptime(daily_at, '%H:%M').time()
+        self.enrich_interval = enrich_interval
+        self.enrich_batch = enrich_batch
+        self.periods = list(dict.fromkeys(periods))
+        self.pool = pool or BrowserPool()
+        self.started_at = datetime.now()
+        self.running = None
+        self.last_runs = {}
+        self.next_runs = {
+            'daily': self._next_daily_run(self.started_at),
+            'enrich': self.started_at + timedelta(seconds=enrich_interval)
+        }
+        # 이번 daily 실행 이후 이미 수집을 시도한 title|year (실패한 콘텐츠 반복 요청 방지)
+        self._attempted = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+        # 조회용 메모리 인덱스 (작업이 끝날 때마다 변경분만 반영)
+        self.index = RankingIndex(DATA_DIR)
+        self._index_lock = threading.Lock()
+
+    def _next_daily_run(self, now):
+        run_at = datetime.combine(now.date(), self.daily_at)
+        if run_at <= now:
+            run_at += timedelta(days=1)
+        return run_at
+
+    def warm_up(self):
+        """
+        브라우저, contents.csv, OTT 설문 캐시, 조회 인덱스를 미리 메모리에 올려둠
+        """
+        print("브라우저와 캐시를 준비합니다.")
+        self.pool.warm_up()
+        if os.path.exists(CONTENTS_FILENAME):
+            pipeline.load_contents(CONTENTS_FILENAME)
+        load_ott_survey()
+        self.refresh_index()
+
+    def refresh_index(self):
+        with self._index_lock:
+            added_rows, updated_contents = self.index.refresh()
+        if added_rows or updated_contents:
+            print(f"조회 인덱스 갱신: 랭킹 {added_rows}행, 콘텐츠 {updated_contents}개")
+
+    def query(self, kind, **params):
+        """
+        조회 인덱스에서 rankings 또는 titles 조회
+        """
+        with self._index_lock:
+            if kind == 'rankings':
+                return self.index.rankings(**params)
+            return self.index.titles(**params)
+
+    def run_now(self, job):
+        """
+        다음 스케줄 루프에서 해당 작업을 바로 실행하도록 예약
+        """
+        with self._lock:
+            self.next_runs[job] = datetime.now()
+
+    def run_daily(self):
+        with self.pool.acquire() as driver:
+            # 상세 장르 수집은 enrich 작업이 조금씩 나눠서 하므로 여기서는 건너뜀
+            train_dfs, timings = pipeline.run_pipeline(driver, self.periods, collect_genres=False)
+        self._attempted.clear()
+        if not train_dfs:
+            raise RuntimeError("남/여 랭킹 데이터를 가져오지 못했습니다.")
+
+        # 일부 기간만 실패해도 나머지 기간의 훈련 데이터는 저장되므로 기간별로 보고
+        result = {
+            period: {'male_rows': len(male_df), 'female_rows': len(female_df)}
+            for period, (male_df, female_df) in train_dfs.items()
+        }
+        failed = [period for period in self.periods if period not in train_dfs]
+        if failed:
+            print(f"{', '.join(failed)} 기간의 랭킹 데이터를 가져오지 못했습니다.")
+            result['failed_periods'] = failed
+        # 여러 기간을 함께 수집했으면 기간별 수집 시간도 /status에 남김
+        if timings:
+            result['crawl_timings'] = {
+                'setup': {'count': timings['setup']['count'],
+                          'seconds': round(timings['setup']['seconds'], 1)},
+                'periods': {
+                    period: {'pages': timing['pages'], 'items': timing['items'],
+                             'seconds': round(timing['seconds'], 1)}
+                    for period, timing in timings['periods'].items()
+                },
+                'total_seconds': round(timings['total_seconds'], 1)
+            }
+        return result
+
+    def run_enrich(self):
+        if not os.path.exists(CONTENTS_FILENAME):
+            return "콘텐츠 파일 없음"
+
+        contents_df = pipeline.load_contents(CONTENTS_FILENAME)
+        keys = contents_df['title'] + '|' + contents_df['year'].astype(str)
+        pending = contents_df[contents_df['genre_detail'].isna() & ~keys.isin(self._attempted)]
+        if pending.empty:
+            return "수집할 콘텐츠 없음"
+
+        batch = pending.head(self.enrich_batch).copy()
+        updated_df = collect_missing_genres(batch)
+        self._attempted.update(keys.loc[batch.index])
+
+        # main.py와 같은 방식으로 수집한 필드만 반영
+        for idx, row in updated_df.iterrows():
+            mask = (contents_df['title'] == row['title']) & (contents_df['year'] == row['year'])
+            for field in pipeline.REQUIRED_FIELDS:
+                if pd.notna(row[field]):
+                    contents_df.loc[mask, field] = row[field]
+
+        pipeline.save_contents(contents_df, CONTENTS_FILENAME)
+        filled = updated_df['genre_detail'].notna().sum()
+        return f"{len(batch)}개 중 {filled}개 상세 정보 수집"
+
+    def _run_job(self, job):
+        started = datetime.now()
+        with self._lock:
+            self.running = job
+        print(f"[{started:%Y-%m-%d %H:%M:%S}] {job} 작업을 시작합니다.")
+
+        record = {'started_at': started.isoformat(timespec='seconds')}
+        begin = time.perf_counter()
+        try:
+            handler = self.run_daily if job == 'daily' else self.run_enrich
+            record['result'] = handler()
+            record['status'] = 'success'
+            self.refresh_index()
+        except Exception as e:
+            print(f"{job} 작업 중 오류 발생: {str(e)}")
+            record['status'] = 'failed'
+            record['error'] = str(e)
+        record['duration_sec'] = round(time.perf_counter() - begin, 2)
+        record['finished_at'] = datetime.now().isoformat(timespec='seconds')
+
+        with self._lock:
+            self.running = None
+            self.last_runs[job] = record
+            if job == 'daily':
+                self.next_runs[job] = self._next_daily_run(datetime.now())
+            else:
+                self.next_runs[job] = datetime.now() + timedelta(seconds=self.enrich_interval)
+        print(f"{job} 작업 종료 ({record['status']}, {record['duration_sec']}초)")
+
+    def serve_forever(self):
+        """
+        예약된 작업을 시각 순서대로 하나씩 실행 (contents.csv 동시 수정 방지)
+        """
+        while not self._stop.is_set():
+            with self._lock:
+                job, run_at = min(self.next_runs.items(), key=lambda item: item[1])
+            wait = (run_at - datetime.now()).total_seconds()
+            if wait > 0:
+                # 최대 1분 단위로 깨어나서 run_now 요청을 반영
+                self._stop.wait(min(wait, 60))
+                continue
+            self._run_job(job)
+
+    def stop(self):
+        self._stop.set()
+
+    def status(self):
+        with self._lock:
+            return {
+                'started_at': self.started_at.isoformat(timespec='seconds'),
+                'running': self.running,
+                'last_runs': dict(self.last_runs),
+                'queue': [
+                    {'job': job, 'next_run': run_at.isoformat(timespec='seconds')}
+                    for job, run_at in sorted(self.next_runs.items(), key=lambda item: item[1])
+                ],
+                'browsers': self.pool.status()
+            }
+
+class StatusHandler(BaseHTTPRequestHandler):
+    """
+    GET /health, /status 요청에 데몬 상태를, /rankings, /titles 요청에 조회 결과를 JSON으로 응답
+    """
+    QUERY_PARAMS = {
+        'rankings': ['period', 'date', 'age_group', 'gender', 'platform', 'genre', 'person'],
+        'titles': ['genre', 'person']
+    }
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        path = url.path.strip('/')
+        daemon = self.server.pipeline_daemon
+
+        if path in ('health', 'status'):
+            result = daemon.status()
+        elif path in self.QUERY_PARAMS:
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            params = {key: query[key] for key in self.QUERY_PARAMS[path] if key in query}
+            try:
+                params['offset'] = int(query.get('offset', 0))
+                params['limit'] = int(query.get('limit', 20))
+            except ValueError:
+                self.send_error(400, 'offset/limit must be integers')
+                return
+            if params['offset'] < 0 or params['limit'] < 0:
+                self.send_error(400, 'offset/limit must not be negative')
+                return
+            result = daemon.query(path, **params)
+        else:
+            self.send_error(404)
+            return
+
+        body = json.dumps(result, ensure_ascii=False, indent=2, default=str).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_status_server(daemon, host='127.0.0.1', port=8765):
+    """
+    상태 확인용 HTTP 서버를 백그라운드 스레드에서 실행
+    """
+    server = ThreadingHTTPServer((host, port), StatusHandler)
+    server.pipeline_daemon = daemon
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    print(f"상태 확인: http://{host}:{port}/status")
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description='데이터 크롤링 파이프라인 스케줄러 데몬')
+    parser.add_argument('--daily-at', default='09:00', help='매일 랭킹을 수집할 시각 (HH:MM)')
+    parser.add_argument('--enrich-interval', type=int, default=600, help='상세 정보 수집 주기 (초)')
+    parser.add_argument('--enrich-batch', type=int, default=20, help='한 번에 상세 정보를 수집할 콘텐츠 수')
+    parser.add_argument('--max-browser-memory', type=int, default=1024, help='브라우저 교체 기준 메모리 (MB)')
+    parser.add_argument('--max-browser-uses', type=int, default=20, help='브라우저 교체 기준 사용 횟수')
+    parser.add_argument('--host', default='127.0.0.1', help='상태 서버 주소')
+    parser.add_argument('--port', type=int, default=8765, help='상태 서버 포트')
+    parser.add_argument('--periods', nargs='+', default=['daily'], choices=list(PERIODS), help='daily 작업에서 수집할 랭킹 기간')
+    parser.add_argument('--run-now', action='store_true', help='시작하자마자 daily 작업 실행')
+    args = parser.parse_args()
+
+    # 작업은 한 번에 하나씩 실행되고 브라우저는 daily 작업만 쓰므로 하나만 띄워둠
+    pool = BrowserPool(1, args.max_browser_memory, args.max_browser_uses)
+    daemon = PipelineDaemon(args.daily_at, args.enrich_interval, args.enrich_batch, pool, args.periods)
+
+    # SIGTERM도 Ctrl+C와 같이 정상 종료 처리
+    signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
+
+    server = start_status_server(daemon, args.host, args.port)
+    try:
+        daemon.warm_up()
+        if args.run_now:
+            daemon.run_now('daily')
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        print("종료 요청을 받았습니다.")
+    finally:
+        daemon.stop()
+        server.shutdown()
+        pool.close()
+        print("데몬을 종료했습니다.")
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,11 @@ import requests
 import re
 import urllib.parse
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+# 위키백과 요청 시 연결을 재사용하기 위한 공용 세션 (연결 풀)
+session = requests.Session()
+session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
 def normalize_names(name_text):
     """
@@ -98,7 +103,7 @@ def collect_wikipedia_info(title, year):
             print(f"위키백과 URL 시도: {wiki_url}")
             
             # 위키백과 페이지 요청
-            response = requests.get(wiki_url, headers=headers)
+            response = session.get(wiki_url, headers=headers)
             
             # 성공적으로 페이지를 가져왔는지 확인
             if response.status_code == 200:
@@ -1,8 +1,9 @@
 import os
 import pandas as pd
 from datetime import datetime
-from crawling_data import scrape_daily_content
+from crawling_data import PERIODS, scrape_daily_content, scrape_multi_period_content
 from genre_collector import collect_missing_genres
+from ott_survey import attach_survey_features
 
 # 모든 필요한 필드를 정의 (broadcast_channel 제거)
 REQUIRED_FIELDS = [
@@ -11,14 +12,66 @@ REQUIRED_FIELDS = [
     'country', 'language'
 ]
 
-def main():
+# contents.csv 메모리 캐시 (파일 경로 -> (수정 시각, 데이터프레임))
+_contents_cache = {}
+
+def load_contents(contents_filename):
+    """
+    contents.csv를 로드하는 함수
+    같은 프로세스에서 파일이 바뀌지 않았다면 메모리에 있는 데이터를 재사용
+    """
+    mtime = os.stat(contents_filename).st_mtime_ns
+    cached = _contents_cache.get(contents_filename)
+    if cached is not None and cached[0] == mtime:
+        return cached[1].copy()
+    
+    contents_df = pd.read_csv(contents_filename)
+    _contents_cache[contents_filename] = (mtime, contents_df)
+    return contents_df.copy()
+
+def save_contents(contents_df, contents_filename):
+    """
+    contents.csv를 저장하고 메모리 캐시를 갱신하는 함수
+    """
+    contents_df.to_csv(contents_filename, index=False)
+    # 저장한 파일을 다시 읽어 캐시에 보관 (dtype을 pd.read_csv 결과와 똑같이 맞추기 위함)
+    _contents_cache[contents_filename] = (os.stat(contents_filename).st_mtime_ns, pd.read_csv(contents_filename))
+
+def main(driver=None, collect_genres=True):
     """
-    데이터 크롤링 파이프라인의 주요 실행 함수
-    1. 오늘 콘텐츠 랭킹 데이터 체크 및 수집
+    데이터 크롤링 파이프라인의 주요 실행 함수 (일간 랭킹)
+    
+    Args:
+        driver: 랭킹 수집에 재사용할 크롬 드라이버 (없으면 수집 시 새로 띄움)
+        collect_genres: False이면 상세 장르 수집을 건너뜀
+    
+    Returns:
+        (남성 훈련 데이터, 여성 훈련 데이터), 실패하면 (None, None)
+    """
+    train_dfs, _ = run_pipeline(driver, ['daily'], collect_genres)
+    return train_dfs.get('daily', (None, None))
+
+def run_pipeline(driver=None, periods=('daily',), collect_genres=True):
+    """
+    여러 랭킹 기간을 한 번에 처리하는 파이프라인 함수
+    1. 오늘 콘텐츠 랭킹 데이터 체크 및 수집 (기간별)
     2. 콘텐츠 정보 통합 저장 (중복 제거)
     3. 상세 장르 정보 수집 (필요한 경우)
-    4. 데이터 병합 및 저장
+    4. 데이터 병합, OTT 설문 세그먼트 피처 추가 및 저장
+    
+    Args:
+        driver: 랭킹 수집에 재사용할 크롬 드라이버 (없으면 수집 시 새로 띄움)
+        periods: 수집할 랭킹 기간 목록 ('daily', 'weekly', 'monthly')
+        collect_genres: False이면 3단계(상세 장르 수집)를 건너뜀 (데몬의 enrich 작업이 대신 수집)
+    
+    Returns:
+        ({기간: (남성 훈련 데이터, 여성 훈련 데이터)} 딕셔너리, 기간별 수집 시간)
+        데이터를 가져오지 못한 기간은 딕셔너리에서 제외 (모두 실패하면 빈 딕셔너리)
+        수집 시간은 scrape_multi_period_content의 timings 형식이며,
+        여러 기간을 함께 수집하지 않았으면 None
     """
+    # 같은 기간이 중복으로 들어와도 한 번만 처리 (순서 유지)
+    periods = list(dict.fromkeys(periods))
     today_str = datetime.now().strftime('%y%m%d')
     data_dir = './data'
     
@@ -27,34 +80,53 @@ def main():
         os.makedirs(data_dir)
     
     # 파일 경로 설정
-    male_filename = f'{data_dir}/daily_MALE_{today_str}.csv'
-    female_filename = f'{data_dir}/daily_FEMALE_{today_str}.csv'
     contents_filename = f'{data_dir}/contents.csv'
     
-    # 1. 오늘 콘텐츠 랭킹 데이터가 있는지 확인
-    if os.path.exists(male_filename) and os.path.exists(female_filename):
-        print(f"이미 오늘({today_str})의 남/여 콘텐츠 랭킹 데이터가 있습니다.")
-        male_df = pd.read_csv(male_filename)
-        female_df = pd.read_csv(female_filename)
-    else:
-        print(f"오늘({today_str})의 콘텐츠 랭킹 데이터를 수집합니다.")
+    # 1. 오늘 기간별 콘텐츠 랭킹 데이터가 있는지 확인
+    ranking_dfs = {}
+    missing_periods = []
+    timings = None
+    for period in periods:
+        male_filename = f'{data_dir}/{period}_MALE_{today_str}.csv'
+        female_filename = f'{data_dir}/{period}_FEMALE_{today_str}.csv'
+        if os.path.exists(male_filename) and os.path.exists(female_filename):
+            print(f"이미 오늘({today_str})의 {period} 남/여 콘텐츠 랭킹 데이터가 있습니다.")
+            ranking_dfs[period] = (pd.read_csv(male_filename), pd.read_csv(female_filename))
+        else:
+            missing_periods.append(period)
+    
+    if missing_periods:
+        print(f"오늘({today_str})의 {', '.join(missing_periods)} 콘텐츠 랭킹 데이터를 수집합니다.")
         # crawling_data.py의 함수를 통해 데이터 수집
-        male_df, female_df = scrape_daily_content()
+        if missing_periods == ['daily']:
+            ranking_dfs['daily'] = scrape_daily_content(driver)
+        else:
+            # 여러 기간은 세그먼트별로 한 세션에서 같이 수집
+            collected, timings = scrape_multi_period_content(missing_periods, driver)
+            ranking_dfs.update(collected)
     
     # 2. 콘텐츠 정보 통합 저장 준비
-    # 남성/여성 데이터에서 고유한 제목 추출
-    if male_df is not None and female_df is not None:
-        all_titles = pd.concat([male_df[['title', 'year', 'genre']], 
-                                female_df[['title', 'year', 'genre']]])
-        all_titles = all_titles.drop_duplicates(subset=['title', 'year']).reset_index(drop=True)
-    else:
+    # 남성/여성 데이터를 가져오지 못한 기간은 제외
+    for period in periods:
+        male_df, female_df = ranking_dfs[period]
+        if male_df is None or female_df is None:
+            print(f"{period} 남/여 데이터를 가져올 수 없어 제외합니다.")
+            del ranking_dfs[period]
+    
+    if not ranking_dfs:
         print("남/여 데이터를 가져올 수 없습니다. 프로그램을 종료합니다.")
-        return None, None
+        return {}, timings
+    
+    # 모든 기간의 남성/여성 데이터에서 고유한 제목 추출
+    all_titles = pd.concat([df[['title', 'year', 'genre']]
+                            for male_df, female_df in ranking_dfs.values()
+                            for df in (male_df, female_df)])
+    all_titles = all_titles.drop_duplicates(subset=['title', 'year']).reset_index(drop=True)
     
     # 3. 기존 콘텐츠 파일이 있는지 확인하고 통합
     if os.path.exists(contents_filename):
         print(f"기존 콘텐츠 정보 파일 {contents_filename}을 로드합니다.")
-        contents_df = pd.read_csv(contents_filename)
+        contents_df = load_contents(contents_filename)
         
         # 새로운 title-year 조합만 추출
         all_titles['key'] = all_titles['title'] + '|' + all_titles['year'].astype(str)
@@ -80,7 +152,7 @@ def main():
             new_titles = new_titles[contents_df.columns]
             contents_df = pd.concat([contents_df, new_titles])
             
-            contents_df.to_csv(contents_filename, index=False)
+            save_contents(contents_df, contents_filename)
             print(f"{len(new_titles)}개의 새로운 콘텐츠를 {contents_filename}에 추가했습니다.")
         else:
             print("추가할 새로운 콘텐츠가 없습니다.")
@@ -96,14 +168,16 @@ def main():
         # 파일 저장 및 부적절한 키 컬럼 제거
         if 'key' in all_titles.columns:
             all_titles = all_titles.drop(columns=['key'])
-        all_titles.to_csv(contents_filename, index=False)
+        save_contents(all_titles, contents_filename)
         contents_df = all_titles.copy()
         print(f"{len(all_titles)}개의 콘텐츠 정보를 저장했습니다.")
     
     # 4. 상세 장르 정보 수집 (genre_detail이 없는 행에 한해서만)
     missing_genres_df = contents_df[contents_df['genre_detail'].isna()].copy()
     
-    if not missing_genres_df.empty:
+    if not collect_genres:
+        print(f"상세 장르 정보 수집을 건너뜁니다 ({len(missing_genres_df)}개 콘텐츠 미수집).")
+    elif not missing_genres_df.empty:
         print(f"{len(missing_genres_df)}개 콘텐츠의 상세 장르 정보를 수집합니다.")
         # 상세 장르 정보 수집
         updated_genres_df = collect_missing_genres(missing_genres_df)
@@ -118,30 +192,45 @@ def main():
                     contents_df.loc[mask, field] = row[field]
         
         # 업데이트된 데이터 저장
-        contents_df.to_csv(contents_filename, index=False)
+        save_contents(contents_df, contents_filename)
         print(f"상세 장르 정보가 업데이트된 콘텐츠 파일을 저장했습니다.")
     else:
         print("상세 장르 정보를 수집할 필요가 없습니다.")
     
-    # 5. 데이터 병합
-    # 남성/여성 데이터와 장르 정보 병합 (모든 추가 필드 포함)
+    # 5. 데이터 병합 (기간별)
     join_columns = ['title', 'year'] + REQUIRED_FIELDS
-    male_with_genres = pd.merge(male_df, contents_df[join_columns], 
-                                on=['title', 'year'], how='left')
-    female_with_genres = pd.merge(female_df, contents_df[join_columns], 
+    train_dfs = {}
+    for period, (male_df, female_df) in ranking_dfs.items():
+        # 남성/여성 데이터와 장르 정보 병합 (모든 추가 필드 포함)
+        male_with_genres = pd.merge(male_df, contents_df[join_columns], 
                                     on=['title', 'year'], how='left')
+        female_with_genres = pd.merge(female_df, contents_df[join_columns], 
+                                        on=['title', 'year'], how='left')
+        
+        # 연령대/성별 세그먼트별 OTT 설문 피처 추가
+        male_with_genres = attach_survey_features(male_with_genres)
+        female_with_genres = attach_survey_features(female_with_genres)
+        
+        # 훈련 데이터 저장 (일간은 기존 파일명 유지, 그 외는 기간 접두사 추가)
+        prefix = '' if period == 'daily' else f'{period}_'
+        male_train_filename = f'{data_dir}/{prefix}male_train_{today_str}.csv'
+        female_train_filename = f'{data_dir}/{prefix}female_train_{today_str}.csv'
+        
+        male_with_genres.to_csv(male_train_filename, index=False)
+        female_with_genres.to_csv(female_train_filename, index=False)
+        
+        print(f"남성 훈련 데이터를 {male_train_filename}에 저장했습니다.")
+        print(f"여성 훈련 데이터를 {female_train_filename}에 저장했습니다.")
+        train_dfs[period] = (male_with_genres, female_with_genres)
     
-    # 훈련 데이터 저장
-    male_train_filename = f'{data_dir}/male_train_{today_str}.csv'
-    female_train_filename = f'{data_dir}/female_train_{today_str}.csv'
-    
-    male_with_genres.to_csv(male_train_filename, index=False)
-    female_with_genres.to_csv(female_train_filename, index=False)
-    
-    print(f"남성 훈련 데이터를 {male_train_filename}에 저장했습니다.")
-    print(f"여성 훈련 데이터를 {female_train_filename}에 저장했습니다.")
-    
-    return male_with_genres, female_with_genres
+    return train_dfs, timings
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='데이터 크롤링 파이프라인')
+    parser.add_argument('--periods', nargs='+', default=['daily'],
+                        choices=list(PERIODS), help='수집할 랭킹 기간')
+    args = parser.parse_args()
+    
+    run_pipeline(periods=args.periods)
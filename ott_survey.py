@@ -0,0 +1,244 @@
+import os
+import re
+import pickle
+import numpy as np
+import pandas as pd
+
+# OTT 설문 데이터 디렉토리 및 캐시 파일 경로
+OTT_DIR = './data/ott'
+CACHE_FILENAME = 'ott_survey_cache.pkl'
+
+# 캐시 형식이 바뀌면 이 값을 올려서 기존 캐시를 무효화
+CACHE_VERSION = 1
+
+# 설문 표 키와 파일명 접두사 (파일명 끝의 다운로드 시각은 제외)
+SURVEYS = {
+    'experience': 'OTT_이용_경험_여부',
+    'experience_service': 'OTT_이용_경험_여부_서비스별',
+    'frequency': 'OTT_이용_빈도',
+    'paid_period': 'OTT_유료서비스_이용기간__전체',
+    'paid_intent_service': 'OTT_유료서비스_계속_이용_의향__서비스별',
+}
+
+# 설문의 서비스 이름 -> 서비스 키 (공백 제거 후 비교, 랭킹 플랫폼 키와 동일하게 맞춤)
+SERVICES = {
+    '넷플릭스': 'netflix',
+    '티빙': 'tving',
+    '쿠팡플레이': 'coupang',
+    '웨이브': 'wavve',
+    '디즈니플러스': 'disney',
+    '왓챠': 'watcha',
+    '유튜브': 'youtube',
+    'NOW': 'now',
+    'U+모바일TV': 'uplus',
+    '카카오TV': 'kakaotv',
+    '아프리카TV': 'afreecatv',
+    '애플TV+': 'appletv',
+    '기타': 'etc'
+}
+
+# 서비스가 아닌 응답 항목 -> 피처 이름
+ITEMS = {
+    '이용 경험 있음': 'used',
+    '이용 경험 없음': 'not_used',
+    '주 1일 미만': 'lt_1day_week',
+    '주 1-2일': '1_2days_week',
+    '주 3-4일': '3_4days_week',
+    '주 5-6일': '5_6days_week',
+    '주 7일': '7days_week',
+    '3개월 미만': 'lt_3m',
+    '3개월-6개월 미만': '3_6m',
+    '6개월-1년 미만': '6_12m',
+    '1년-1년 6개월 미만': '12_18m',
+    '1년 6개월-2년 미만': '18_24m',
+    '2년 이상': 'gte_24m',
+    '이용의향 모두 없음': 'no_intent',
+    'OTT비이용': 'non_user',
+    'OTT 비이용': 'non_user',
+    '비이용': 'non_user',
+    '유료서비스 비이용': 'non_user'
+}
+
+# 설문 구분 값 -> 랭킹 데이터의 age_group / gender 값
+AGE_LABELS = {
+    '13~19세': '10대',
+    '13-19세': '10대'
+}
+
+GENDER_LABELS = {
+    '남자': '남성',
+    '여자': '여성'
+}
+
+ALL_LABEL = '전체'
+SAMPLE_COLUMN = '사례수 (가구원)'
+SEGMENT_KEYS = ['age_group', 'gender']
+
+# 같은 프로세스 안에서 반복 호출 시 디스크 접근을 피하기 위한 메모리 캐시
+_memory_cache = {}
+
+def find_survey_files(ott_dir=OTT_DIR):
+    """
+    설문 표 키별로 가장 최근에 받은 CSV 파일 경로를 찾는 함수
+
+    Returns:
+        {설문 키: 파일 경로} 딕셔너리 (파일이 없는 표는 제외)
+    """
+    if not os.path.isdir(ott_dir):
+        return {}
+
+    filenames = sorted(os.listdir(ott_dir))
+    files = {}
+    for key, prefix in SURVEYS.items():
+        # 접두사 뒤에 다운로드 시각만 붙은 파일만 매칭 (서비스별 표와 구분)
+        pattern = re.compile(rf'^{re.escape(prefix)}_\d+\.csv$')
+        matched = [name for name in filenames if pattern.match(name)]
+        if matched:
+            files[key] = os.path.join(ott_dir, matched[-1])
+
+    return files
+
+def _source_signature(files):
+    """
+    원본 파일의 경로, 수정 시각, 크기로 캐시 유효성 확인용 서명 생성
+    """
+    signature = [CACHE_VERSION]
+    for key in sorted(files):
+        stat = os.stat(files[key])
+        signature.append((key, os.path.basename(files[key]), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+def parse_survey_file(key, path):
+    """
+    KOSIS 형식의 넓은 설문 CSV 하나를 긴 형식으로 변환하는 함수
+
+    첫 줄(조사 연도)은 건너뛰고 두 번째 줄을 헤더로 사용하며,
+    지역별 행은 제외하고 전체/성별/연령별 행만 남긴다.
+
+    Returns:
+        survey, service, age_group, gender, item, value, sample_size 컬럼의 데이터프레임
+    """
+    df = pd.read_csv(path, encoding='cp949', header=1)
+    df = df.rename(columns={df.columns[0]: 'category', df.columns[1]: 'group'})
+    df = df[df['category'].isin([ALL_LABEL, '성별', '연령별'])]
+
+    value_columns = [col for col in df.columns if col not in ('category', 'group', SAMPLE_COLUMN)]
+    long_df = df.melt(id_vars=['category', 'group', SAMPLE_COLUMN], value_vars=value_columns,
+                      var_name='item', value_name='value')
+
+    long_df['item'] = long_df['item'].str.replace(r'\s*\(%\)$', '', regex=True)
+    long_df['value'] = pd.to_numeric(long_df['value'], errors='coerce')
+    long_df['survey'] = key
+
+    # 항목이 서비스 이름이면 서비스 키로, 아니면 '전체'로 구분
+    long_df['service'] = long_df['item'].str.replace(' ', '', regex=False).map(SERVICES).fillna(ALL_LABEL)
+
+    # 구분 값을 랭킹 데이터의 age_group / gender 값으로 변환
+    is_age = long_df['category'] == '연령별'
+    is_gender = long_df['category'] == '성별'
+    long_df['age_group'] = long_df['group'].replace(AGE_LABELS).where(is_age, ALL_LABEL)
+    long_df['gender'] = long_df['group'].replace(GENDER_LABELS).where(is_gender, ALL_LABEL)
+
+    long_df = long_df.rename(columns={SAMPLE_COLUMN: 'sample_size'})
+    return long_df[['survey', 'service', 'age_group', 'gender', 'item', 'value', 'sample_size']]
+
+def _feature_names(long_df):
+    """
+    긴 형식 행마다 ott_<설문>_<서비스 또는 항목> 형태의 피처 이름 생성
+    """
+    item_slugs = long_df['item'].map(ITEMS)
+    fallback = long_df['item'].str.replace(r'\W+', '_', regex=True).str.strip('_')
+    suffix = long_df['service'].where(long_df['service'] != ALL_LABEL, item_slugs.fillna(fallback))
+    return 'ott_' + long_df['survey'] + '_' + suffix
+
+def build_segment_features(long_df):
+    """
+    연령별/성별 주변 분포로부터 (age_group, gender) 세그먼트별 피처 벡터를 계산하는 함수
+
+    설문은 연령과 성별을 따로 집계하므로, 두 변수가 독립이라고 보고
+    연령 비율 * 성별 비율 / 전체 비율 로 세그먼트 비율을 추정한다.
+
+    Returns:
+        age_group, gender 와 ott_* 피처 컬럼을 가진 데이터프레임
+    """
+    long_df = long_df.assign(feature=_feature_names(long_df))
+    wide = long_df.pivot_table(index=SEGMENT_KEYS, columns='feature', values='value', aggfunc='first')
+
+    total = wide.loc[(ALL_LABEL, ALL_LABEL)].to_numpy()
+    by_age = wide.xs(ALL_LABEL, level='gender').drop(index=ALL_LABEL, errors='ignore')
+    by_gender = wide.xs(ALL_LABEL, level='age_group').drop(index=ALL_LABEL, errors='ignore')
+
+    # (연령, 성별, 피처) 형태로 한 번에 계산
+    with np.errstate(divide='ignore', invalid='ignore'):
+        combined = by_age.to_numpy()[:, None, :] * by_gender.to_numpy()[None, :, :] / total
+    combined = np.where(total > 0, combined, 0.0)
+    combined = np.clip(combined, 0.0, 100.0).round(2)
+
+    index = pd.MultiIndex.from_product([by_age.index, by_gender.index], names=SEGMENT_KEYS)
+    features = pd.DataFrame(combined.reshape(-1, len(wide.columns)), index=index, columns=wide.columns)
+    features.columns.name = None
+    return features.reset_index()
+
+def load_ott_survey(ott_dir=OTT_DIR, use_cache=True):
+    """
+    OTT 설문 표를 한 번만 파싱하고 결과를 바이너리 캐시에 저장/재사용하는 함수
+
+    원본 CSV의 수정 시각이나 크기가 바뀌면 캐시를 다시 만든다.
+
+    Returns:
+        (긴 형식 설문 데이터프레임, 세그먼트 피처 데이터프레임)
+        설문 파일이 없으면 (None, None)
+    """
+    files = find_survey_files(ott_dir)
+    if not files:
+        return None, None
+
+    signature = _source_signature(files)
+    cache_path = os.path.join(ott_dir, CACHE_FILENAME)
+
+    if use_cache:
+        cached = _memory_cache.get(cache_path)
+        if cached is None and os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as f:
+                    cached = pickle.load(f)
+            except Exception as e:
+                print(f"OTT 설문 캐시 {cache_path}를 읽는 중 오류 발생: {str(e)}")
+                cached = None
+
+        if cached is not None and cached['signature'] == signature:
+            _memory_cache[cache_path] = cached
+            return cached['long'], cached['features']
+
+    print(f"OTT 설문 파일 {len(files)}개를 파싱합니다.")
+    long_df = pd.concat([parse_survey_file(key, path) for key, path in files.items()], ignore_index=True)
+    features_df = build_segment_features(long_df)
+
+    cached = {'signature': signature, 'long': long_df, 'features': features_df}
+    _memory_cache[cache_path] = cached
+
+    if use_cache:
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"OTT 설문 캐시 {cache_path}를 저장하는 중 오류 발생: {str(e)}")
+
+    return long_df, features_df
+
+def attach_survey_features(df, ott_dir=OTT_DIR):
+    """
+    랭킹/훈련 데이터의 각 행에 (age_group, gender) 세그먼트 설문 피처를 붙이는 함수
+
+    Args:
+        df: age_group, gender 컬럼이 있는 데이터프레임
+
+    Returns:
+        ott_* 피처 컬럼이 추가된 데이터프레임 (설문 파일이 없으면 원본 그대로)
+    """
+    _, features_df = load_ott_survey(ott_dir)
+    if features_df is None:
+        print(f"{ott_dir}에 OTT 설문 파일이 없어 설문 피처를 추가하지 않습니다.")
+        return df
+
+    return pd.merge(df, features_df, on=SEGMENT_KEYS, how='left')
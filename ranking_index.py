@@ -0,0 +1,332 @@
+import os
+import re
+import pandas as pd
+
+DATA_DIR = './data'
+CONTENTS_FILENAME = 'contents.csv'
+
+# main.py가 만드는 훈련 데이터 파일 (일간은 접두사 없음, fixed_* 수작업 파일은 제외)
+TRAIN_FILE_PATTERN = re.compile(r'^(?:(weekly|monthly)_)?(male|female)_train_(\d{6})\.csv$')
+
+# 랭킹 행에 그대로 보관하는 컬럼
+RANKING_FIELDS = ['rank', 'title', 'genre', 'year', 'score', 'platform', 'platform_ranks', 'age_group', 'gender']
+
+# 콘텐츠 메타데이터로 보관하는 컬럼 (contents.csv 기준)
+CONTENT_FIELDS = [
+    'title', 'year', 'genre', 'genre_detail', 'director', 'runtime', 'streaming', 'production',
+    'rating', 'broadcast_period', 'episodes', 'cast', 'country', 'language'
+]
+
+# 출연자/감독 목록에서 이름이 아닌 토큰
+NAME_STOPWORDS = {'외', '등'}
+
+def _content_key(title, year):
+    return (str(title), str(year))
+
+def _split_list(value):
+    """
+    쉼표로 구분된 값(플랫폼, 상세 장르)을 목록으로 분리
+    """
+    if value is None or pd.isna(value):
+        return []
+    return [part.strip() for part in str(value).split(',') if part.strip()]
+
+def _platform_ranks(value):
+    """
+    combine_duplicate_contents가 남긴 "netflix:1, tving:5" 형식의 플랫폼별 순위를 딕셔너리로 변환
+    (플랫폼별 순위가 없는 예전 파일이면 빈 딕셔너리)
+    """
+    ranks = {}
+    for item in _split_list(value):
+        name, _, rank = item.partition(':')
+        if rank.isdigit():
+            ranks[name.strip()] = int(rank)
+    return ranks
+
+def _name_words(value):
+    """
+    normalize_names로 정규화된 출연자/감독 문자열을 순서대로 단어 목록으로 분리
+    "A B C" 형식이라 이름 사이 경계는 남아 있지 않음
+    """
+    if value is None or pd.isna(value):
+        return []
+    return [word for word in re.split(r'[\s,]+', str(value)) if word and word not in NAME_STOPWORDS]
+
+def _name_tokens(value):
+    """
+    출연자/감독 문자열을 검색용 토큰 집합으로 분리 (여러 단어로 된 이름은 단어마다 토큰)
+    """
+    return set(_name_words(value))
+
+def _contains_words(value, words):
+    """
+    value의 단어 목록 안에 words가 같은 순서로 연속해서 나오는지 확인
+    """
+    return f" {' '.join(words)} " in f" {' '.join(_name_words(value))} "
+
+def _check_page(offset, limit):
+    """
+    페이지 범위 확인 (음수면 파이썬 슬라이스가 뒤에서부터 잘라버리므로 거부)
+    """
+    if offset < 0 or limit < 0:
+        raise ValueError(f"offset과 limit은 0 이상이어야 합니다: offset={offset}, limit={limit}")
+
+def _clean(value):
+    if value is None or pd.isna(value):
+        return None
+    return value.item() if hasattr(value, 'item') else value
+
+class RankingIndex:
+    """
+    파이프라인 출력(*_train_*.csv, contents.csv) 위에 만든 메모리 인덱스
+
+    - 랭킹 행 인덱스: 기간, 날짜, (연령대, 성별) 세그먼트, 플랫폼
+    - 콘텐츠 인덱스: 장르(genre, genre_detail), 출연자/감독 역색인
+
+    refresh()는 새로 생긴 훈련 파일과 contents.csv에서 바뀐 콘텐츠만 반영한다.
+    """
+    def __init__(self, data_dir=DATA_DIR):
+        self.data_dir = data_dir
+        self.rows = []
+        self.contents = {}
+        self.dates = []
+        self.latest_dates = {}
+
+        # 랭킹 행 단위 인덱스 (값 -> 행 번호 집합)
+        self.by_period = {}
+        self.by_date = {}
+        self.by_segment = {}
+        self.by_platform = {}
+        # 플랫폼 -> {행 번호: 해당 플랫폼에서의 순위}
+        self.platform_ranks = {}
+
+        # 콘텐츠 단위 인덱스 (값 -> 콘텐츠 키 집합)
+        self.by_genre = {}
+        self.by_person = {}
+        self.content_rows = {}
+
+        self._loaded_files = {}
+        self._contents_mtime = None
+        self._content_tokens = {}
+
+    def load(self):
+        """
+        처음 로드 (이미 로드된 뒤에는 refresh와 같음)
+        """
+        return self.refresh()
+
+    def refresh(self):
+        """
+        새 훈련 파일과 contents.csv 변경분을 인덱스에 반영
+
+        Returns:
+            (추가된 랭킹 행 수, 갱신된 콘텐츠 수)
+        """
+        added_rows = 0
+        if os.path.isdir(self.data_dir):
+            for name in sorted(os.listdir(self.data_dir)):
+                match = TRAIN_FILE_PATTERN.match(name)
+                if not match:
+                    continue
+                path = os.path.join(self.data_dir, name)
+                mtime = os.stat(path).st_mtime_ns
+                if self._loaded_files.get(name) == mtime:
+                    continue
+                if name in self._loaded_files:
+                    # 같은 날짜 파일이 다시 저장된 경우 해당 파일의 행만 교체
+                    self._remove_file_rows(name)
+                added_rows += self._add_train_file(name, path, match.group(1) or 'daily', match.group(3))
+                self._loaded_files[name] = mtime
+
+        updated_contents = self._refresh_contents()
+        self.dates = sorted(self.by_date, reverse=True)
+        # 기간별 가장 최근 날짜 (날짜 없이 조회할 때 사용)
+        self.latest_dates = {}
+        for period, row_ids in self.by_period.items():
+            period_dates = [date for date in self.dates if self.by_date[date] & row_ids]
+            if period_dates:
+                self.latest_dates[period] = period_dates[0]
+        return added_rows, updated_contents
+
+    def _add_train_file(self, name, path, period, date):
+        df = pd.read_csv(path)
+        df = df.drop_duplicates(subset=['title', 'year', 'age_group', 'gender']).reset_index(drop=True)
+        content_columns = [col for col in CONTENT_FIELDS if col in df.columns]
+
+        for record in df.to_dict('records'):
+            row_id = len(self.rows)
+            row = {field: _clean(record.get(field)) for field in RANKING_FIELDS}
+            row['period'] = period
+            row['date'] = date
+            row['source'] = name
+            self.rows.append(row)
+
+            self.by_period.setdefault(period, set()).add(row_id)
+            self.by_date.setdefault(date, set()).add(row_id)
+            self.by_segment.setdefault((row['age_group'], row['gender']), set()).add(row_id)
+            for platform in _split_list(row['platform']):
+                self.by_platform.setdefault(platform, set()).add(row_id)
+            for platform, rank in _platform_ranks(row['platform_ranks']).items():
+                self.platform_ranks.setdefault(platform, {})[row_id] = rank
+
+            key = _content_key(row['title'], row['year'])
+            self.content_rows.setdefault(key, set()).add(row_id)
+            # contents.csv에 없는 콘텐츠는 훈련 파일의 메타데이터로 채움
+            if key not in self.contents:
+                self._set_content(key, {col: _clean(record.get(col)) for col in content_columns})
+
+        return len(df)
+
+    def _remove_file_rows(self, name):
+        for row_id, row in enumerate(self.rows):
+            if row is None or row['source'] != name:
+                continue
+            self.by_period[row['period']].discard(row_id)
+            self.by_date[row['date']].discard(row_id)
+            self.by_segment[(row['age_group'], row['gender'])].discard(row_id)
+            for platform in _split_list(row['platform']):
+                self.by_platform[platform].discard(row_id)
+            for platform in _platform_ranks(row['platform_ranks']):
+                self.platform_ranks[platform].pop(row_id, None)
+            self.content_rows[_content_key(row['title'], row['year'])].discard(row_id)
+            # 행 번호가 바뀌지 않도록 자리는 남겨둠
+            self.rows[row_id] = None
+
+    def _refresh_contents(self):
+        path = os.path.join(self.data_dir, CONTENTS_FILENAME)
+        if not os.path.exists(path):
+            return 0
+        mtime = os.stat(path).st_mtime_ns
+        if mtime == self._contents_mtime:
+            return 0
+
+        df = pd.read_csv(path)
+        columns = [col for col in CONTENT_FIELDS if col in df.columns]
+        updated = 0
+        for record in df[columns].to_dict('records'):
+            content = {col: _clean(record[col]) for col in columns}
+            key = _content_key(content['title'], content['year'])
+            if self.contents.get(key) != content:
+                self._set_content(key, content)
+                updated += 1
+
+        self._contents_mtime = mtime
+        return updated
+
+    def _set_content(self, key, content):
+        """
+        콘텐츠 메타데이터를 저장하고 바뀐 토큰만 장르/인물 인덱스에 반영
+        """
+        genres = {content.get('genre')} | set(_split_list(content.get('genre_detail')))
+        genres.discard(None)
+        people = _name_tokens(content.get('cast')) | _name_tokens(content.get('director'))
+
+        old_genres, old_people = self._content_tokens.get(key, (set(), set()))
+        for genre in old_genres - genres:
+            self.by_genre[genre].discard(key)
+        for genre in genres - old_genres:
+            self.by_genre.setdefault(genre, set()).add(key)
+        for person in old_people - people:
+            self.by_person[person].discard(key)
+        for person in people - old_people:
+            self.by_person.setdefault(person, set()).add(key)
+
+        self.contents[key] = content
+        self._content_tokens[key] = (genres, people)
+
+    def _content_filter(self, genre=None, person=None):
+        """
+        장르/인물 조건을 만족하는 콘텐츠 키 집합 (조건이 없으면 None)
+        """
+        candidates = []
+        words = _name_words(person) if person else []
+        if genre:
+            candidates.append(self.by_genre.get(genre, set()))
+        if person:
+            candidates.extend(self.by_person.get(word, set()) for word in words)
+        if not candidates:
+            return None
+        candidates.sort(key=len)
+        keys = set.intersection(*candidates)
+
+        if len(words) > 1:
+            # 여러 단어로 된 이름은 단어가 같은 순서로 붙어 있는 콘텐츠만 남김
+            # (다른 사람 이름의 단어끼리 맞는 경우 제외)
+            keys = {
+                key for key in keys
+                if _contains_words(self.contents[key].get('cast'), words)
+                or _contains_words(self.contents[key].get('director'), words)
+            }
+        return keys
+
+    def rankings(self, date=None, age_group=None, gender=None, platform=None,
+                 genre=None, person=None, offset=0, limit=20, period='daily'):
+        """
+        조건에 맞는 랭킹 행을 순위 순으로 페이지 단위 조회
+
+        platform을 지정하면 해당 플랫폼에서의 순위로 정렬하고 결과의 rank도 그 순위로 바꾼다.
+        플랫폼별 순위(platform_ranks)가 없는 예전 파일의 행은 rank가 None이 되고 뒤쪽에 놓인다.
+
+        Args:
+            date: 'YYMMDD' 형식 날짜 (없으면 해당 기간의 가장 최근 날짜)
+            age_group: 연령대 (예: '30대')
+            gender: 성별 ('남성' 또는 '여성')
+            platform: 플랫폼 키 (예: 'tving')
+            genre: genre 또는 genre_detail 값 (예: '드라마', '로맨스')
+            person: 출연자/감독 이름
+            offset, limit: 페이지 범위
+            period: 랭킹 기간 ('daily', 'weekly', 'monthly')
+
+        Returns:
+            {'total': 전체 건수, 'offset', 'limit', 'items': 콘텐츠 정보가 합쳐진 행 목록}
+        """
+        _check_page(offset, limit)
+        date = date or self.latest_dates.get(period)
+        candidates = [self.by_period.get(period, set()), self.by_date.get(date, set())]
+        if age_group and gender:
+            candidates.append(self.by_segment.get((age_group, gender), set()))
+        elif age_group or gender:
+            candidates.append(set().union(*(
+                ids for (age, sex), ids in self.by_segment.items()
+                if age_group in (None, age) and gender in (None, sex)
+            )))
+        if platform:
+            candidates.append(self.by_platform.get(platform, set()))
+
+        keys = self._content_filter(genre, person)
+        if keys is not None:
+            candidates.append(set().union(*(self.content_rows.get(key, set()) for key in keys)))
+
+        candidates.sort(key=len)
+        row_ids = set.intersection(*candidates)
+        if platform:
+            # 병합된 rank는 다른 플랫폼의 순위일 수 있어 요청한 플랫폼의 순위를 사용
+            ranks = self.platform_ranks.get(platform, {})
+            ordered = sorted(row_ids, key=lambda row_id: (row_id not in ranks, ranks.get(row_id, 0), row_id))
+        else:
+            ordered = sorted(row_ids, key=lambda row_id: (self.rows[row_id]['rank'], row_id))
+
+        items = []
+        for row_id in ordered[offset:offset + limit]:
+            row = self.rows[row_id]
+            content = self.contents.get(_content_key(row['title'], row['year']), {})
+            item = {**content, **row}
+            if platform:
+                item['rank'] = ranks.get(row_id)
+            items.append(item)
+        return {'total': len(ordered), 'offset': offset, 'limit': limit, 'items': items}
+
+    def titles(self, genre=None, person=None, offset=0, limit=20):
+        """
+        장르/출연자/감독 조건에 맞는 콘텐츠 메타데이터를 제목 순으로 페이지 단위 조회
+
+        Returns:
+            {'total': 전체 건수, 'offset', 'limit', 'items': 콘텐츠 정보 목록}
+        """
+        _check_page(offset, limit)
+        keys = self._content_filter(genre, person)
+        if keys is None:
+            keys = self.contents.keys()
+        ordered = sorted(keys)
+        items = [self.contents[key] for key in ordered[offset:offset + limit]]
+        return {'total': len(ordered), 'offset': offset, 'limit': limit, 'items': items}